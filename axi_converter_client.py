@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import socket
+
+from axi_converter import get_argument_parser, get_sweep_widths
+
+# Client -------------------------------------------------------------------------------------------
+
+def main():
+    parser = get_argument_parser()
+    parser.description = "AXI Converter build daemon client"
+    parser.add_argument("--socket", default="/tmp/axi_converter.sock", help="Unix socket path (default=/tmp/axi_converter.sock).")
+    args = parser.parse_args()
+    if args.sweep:
+        try:
+            get_sweep_widths(args.sweep)
+        except ValueError as e:
+            parser.error(str(e))
+
+    request = vars(args)
+    socket_path = request.pop("socket")
+    request.pop("daemon")
+    # Builds run from the client's directory, not the daemon's.
+    request["cwd"] = os.getcwd()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(socket_path)
+        s.sendall((json.dumps(request) + "\n").encode())
+        response = json.loads(s.makefile("r").readline())
+
+    if response["status"] != "ok":
+        print(f"axi_converter: {response['message']}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
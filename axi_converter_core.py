@@ -0,0 +1,868 @@
+import os
+import sys
+import shutil
+import filecmp
+import tempfile
+import subprocess
+import hashlib
+import gzip
+import mmap
+import io
+import functools
+import threading
+from string import Template
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from migen import Module, ClockDomain, Signal, Cat, Instance
+
+from litex.build.generic_platform import Pins
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.axi import AXIStreamInterface, AXILiteInterface
+from litex.soc.interconnect import csr_eventmanager as ev
+from litex.soc.interconnect import wishbone
+
+__all__ = [
+    "AXIConverter",
+    "get_clkin_ios",
+    "get_gui_interface",
+    "get_custom_interface",
+    "declare_custom_interface",
+    "get_interface_clocks",
+    "get_generic_parameters",
+    "build_gui",
+    "build_custom_buses",
+    "run_vivado",
+    "run_vivado_scripts",
+    "run_vivado_stages",
+    "generate_interface",
+    "generate_package",
+    "generate_project",
+]
+
+# Tcl procedures, stored without their surrounding blank lines.
+proc_define_interface = """
+proc proc_define_interface { name } {
+  
+  ipx::create_abstraction_definition Enjoy-Digital.com interface ${name}_rtl 1.0
+  ipx::create_bus_definition Enjoy-Digital.com interface $name 1.0
+
+  set_property xml_file_name ${name}_rtl.xml [ipx::current_busabs]
+  set_property xml_file_name ${name}.xml [ipx::current_busdef]
+  set_property bus_type_vlnv Enjoy-Digital.com:interface:${name}:1.0 [ipx::current_busabs]
+
+  ipx::save_abstraction_definition [ipx::current_busabs]
+  ipx::save_bus_definition [ipx::current_busdef]
+
+}
+""".strip() + "\n"
+
+proc_define_interface_port = """
+proc proc_define_interface_port {name width dir {type none}} {
+
+  ipx::add_bus_abstraction_port $name [ipx::current_busabs]
+  set m_intf [ipx::get_bus_abstraction_ports $name -of_objects [ipx::current_busabs]]
+  set_property master_presence required $m_intf
+  set_property slave_presence  required $m_intf
+  set_property master_width $width $m_intf
+  set_property slave_width  $width $m_intf
+
+  set m_dir "in"
+  set s_dir "out"
+  if {$dir eq "output"} {
+    set m_dir "out"
+    set s_dir "in"
+  }
+
+  set_property master_direction $m_dir $m_intf
+  set_property slave_direction  $s_dir $m_intf
+
+  if {$type ne "none"} {
+    set_property is_${type} true $m_intf
+  }
+
+  ipx::save_bus_definition [ipx::current_busdef]
+  ipx::save_abstraction_definition [ipx::current_busabs]
+}
+""".strip() + "\n"
+
+proc_set_version = """
+proc proc_set_version { {ip_name "ip_tbd"}   \
+                        {version_number "1.0"}  \
+                        {core_revision_number "0"}  \
+                        {display_name "display TBD"}  \
+                        {description "description TBD"}  \
+                        {vendor_name "Enjoy-Digital"}   \
+                        {company_url "http://www.enjoy-digital.fr/"}  \
+  } {
+  # Management of version/revision
+  set_property version $version_number [ipx::current_core]
+  set_property core_revision  $core_revision_number [ipx::current_core]
+  set_property display_name $display_name [ipx::current_core]
+  set_property description $description [ipx::current_core]
+
+  set_property name $ip_name [ipx::current_core]
+  set_property vendor_display_name $vendor_name [ipx::current_core]
+  set_property company_url $company_url [ipx::current_core]
+
+}
+""".strip() + "\n"
+
+proc_set_device_family = """
+proc proc_set_device_family { {setting "all"} } {
+  # Management of supported families
+  if { $setting eq "all" } {
+      set i_families ""
+      foreach i_part [get_parts] {
+        lappend i_families [get_property FAMILY $i_part]
+      }
+      set i_families [lsort -unique $i_families]
+      set s_families [get_property supported_families [ipx::current_core]]
+      foreach i_family $i_families {
+        set s_families "$s_families $i_family Production"
+        set s_families "$s_families $i_family Beta"
+      }
+  } else {
+    set s_families $setting
+  }
+  set_property supported_families $s_families [ipx::current_core]
+  puts "got $s_families.\n"
+}
+""".strip() + "\n"
+
+proc_archive_ip = """
+proc proc_archive_ip { vendor_name ip_name {version_number "1.0"} } {
+  # Management of archiving of the IP
+  set archive_name "./"
+  append archive_name $vendor_name "_" $ip_name "_" $version_number ".zip"
+  ipx::archive_core $archive_name [ipx::current_core]
+}
+""".strip() + "\n"
+
+proc_declare_interrupt = """
+proc proc_declare_interrupt { irq_name } {
+  # declaration of the interrupt
+  ipx::infer_bus_interface $irq_name xilinx.com:signal:interrupt_rtl:1.0 [ipx::current_core]
+}
+""".strip() + "\n"
+
+proc_add_bus_clock = """
+proc proc_add_bus_clock {clock_signal_name bus_inf_name {reset_signal_name ""} {reset_signal_mode "slave"}} {
+  set bus_inf_name_clean [string map {":" "_"} $bus_inf_name]
+  set clock_inf_name [format "%s%s" $bus_inf_name_clean "_signal_clock"]
+  set clock_inf [ipx::add_bus_interface $clock_inf_name [ipx::current_core]]
+  set_property abstraction_type_vlnv "xilinx.com:signal:clock_rtl:1.0" $clock_inf
+  set_property bus_type_vlnv "xilinx.com:signal:clock:1.0" $clock_inf
+  set_property display_name $clock_inf_name $clock_inf
+  set clock_map [ipx::add_port_map "CLK" $clock_inf]
+  set_property physical_name $clock_signal_name $clock_map
+
+  set assoc_busif [ipx::add_bus_parameter "ASSOCIATED_BUSIF" $clock_inf]
+  set_property value $bus_inf_name $assoc_busif
+
+  if { $reset_signal_name != "" } {
+    set assoc_reset [ipx::add_bus_parameter "ASSOCIATED_RESET" $clock_inf]
+    set_property value $reset_signal_name $assoc_reset
+
+    set reset_inf_name [format "%s%s" $bus_inf_name_clean "_signal_reset"]
+    set reset_inf [ipx::add_bus_interface $reset_inf_name [ipx::current_core]]
+    set_property abstraction_type_vlnv "xilinx.com:signal:reset_rtl:1.0" $reset_inf
+    set_property bus_type_vlnv "xilinx.com:signal:reset:1.0" $reset_inf
+    set_property display_name $reset_inf_name $reset_inf
+    set_property interface_mode $reset_signal_mode $reset_inf
+    set reset_map [ipx::add_port_map "RST" $reset_inf]
+    set_property physical_name $reset_signal_name $reset_map
+
+    set reset_polarity [ipx::add_bus_parameter "POLARITY" $reset_inf]
+    if {[string match {*[Nn]} $reset_signal_name] == 1} {
+      set_property value "ACTIVE_LOW" $reset_polarity
+    } else {
+      set_property value "ACTIVE_HIGH" $reset_polarity
+    }
+  }
+}
+""".strip() + "\n"
+
+proc_add_bus = """
+# Add a new port map definition to a bus interface.
+proc proc_add_port_map {bus phys logic} {
+  set map [ipx::add_port_map $phys $bus]
+  set_property "PHYSICAL_NAME" $phys $map
+  set_property "LOGICAL_NAME" $logic $map
+}
+
+proc proc_add_bus {bus_name mode abs_type bus_type port_maps} {
+  set bus [ipx::add_bus_interface $bus_name [ipx::current_core]]
+
+  set_property "ABSTRACTION_TYPE_VLNV" $abs_type $bus
+  set_property "BUS_TYPE_VLNV" $bus_type $bus
+  set_property "INTERFACE_MODE" $mode $bus
+
+  foreach port_map $port_maps {
+    proc_add_port_map $bus {*}$port_map
+  }
+}
+
+""".strip() + "\n"
+
+proc_add_ip_files = """
+proc proc_add_ip_files {ip_name ip_files} {
+  set proj_fileset [get_filesets sources_1]
+  foreach m_file $ip_files {
+    puts "got the following file to add: $m_file.\n"
+    if {[file extension $m_file] eq ".xdc"} {
+      add_files -copy_to ./src -norecurse -fileset constrs_1 $m_file
+    } else {
+      add_files -copy_to ./src -norecurse -fileset $proj_fileset $m_file
+    }
+  }
+  set_property "top" "$ip_name" $proj_fileset
+}
+""".strip() + "\n"
+
+# Procedures declared by the custom interfaces script, joined once at import.
+interface_procs = "\n".join([
+    proc_define_interface,
+    proc_define_interface_port,
+])
+
+# Procedures declared by the core packager script, joined once at import.
+packager_procs = "\n".join([
+    proc_add_ip_files,
+    proc_add_bus,
+    proc_add_bus_clock,
+    proc_declare_interrupt,
+    proc_set_version,
+    proc_set_device_family,
+    proc_archive_ip,
+])
+
+# GUI Interfaces -----------------------------------------------------------------------------------
+
+gui_interface = {
+    'AXI Lite' : 
+        {
+        'order': 0,
+        'vars' : 
+            {
+            'address_width' : 
+                {
+                'order' : 0,
+                },
+            },
+        },
+    'AXI Stream' :
+        {
+        'order': 1,
+        'vars' : 
+            {
+            'input_width' : 
+                {
+                'order' : 0,
+                },
+            'output_width' : 
+                {
+                'order' : 1,
+                },
+            'user_width' : 
+                {
+                'order' : 2,
+                },
+            },
+        },
+    'Misc' :
+        {
+        'order': 2,
+        'vars' : 
+            {
+            'reverse' : 
+                {
+                'order' : 0,
+                },
+            },
+        },
+
+}
+
+def get_gui_interface():
+    return gui_interface
+
+# Custom Interfaces -------------------------------------------------------------------------------
+
+custom_interface = {
+    'wishbone' : 
+        {
+        'name': 'wishbone_in',
+        'type': 'slave',
+        'signals' : 
+            {
+                'wishbone_in_adr'   : 'wishbone_adr',
+                'wishbone_in_dat_w' : 'wishbone_dat_w',
+                'wishbone_in_dat_r' : 'wishbone_dat_r',
+                'wishbone_in_sel'   : 'wishbone_sel',
+                'wishbone_in_cyc'   : 'wishbone_cyc',
+                'wishbone_in_stb'   : 'wishbone_stb',
+                'wishbone_in_ack'   : 'wishbone_ack',
+                'wishbone_in_we'    : 'wishbone_we',
+                'wishbone_in_cti'   : 'wishbone_cti',
+                'wishbone_in_bte'   : 'wishbone_bte',
+                'wishbone_in_err'   : 'wishbone_err',
+            },
+        },
+}
+
+def get_custom_interface():
+    return custom_interface
+
+
+custom_interface_declaration = {
+    'wishbone' : 
+        {
+        'signals' : 
+            [
+                ("wishbone_adr","30","input"),
+                ("wishbone_dat_w","16","input"),
+                ("wishbone_dat_r","16","output"),
+                ("wishbone_sel","2","input"),
+                ("wishbone_cyc","1","input"),
+                ("wishbone_stb","1","input"),
+                ("wishbone_ack","1","output"),
+                ("wishbone_we","1","input"),
+                ("wishbone_cti","3","input"),
+                ("wishbone_bte","2","input"),
+                ("wishbone_err","1","output"),
+            ],
+        },
+}
+
+def declare_custom_interface():
+    return custom_interface_declaration
+
+# Interfaces Clock & resets ------------------------------------------------------------------------
+
+interface_clocks = {
+    'Wishbone' :
+       {
+        'clock_domain': 'axilite_clk',
+        'reset': 'axilite_rst',
+        'interfaces': 'wishbone_in',
+        },
+    'AXI Stream' :
+        {
+        'clock_domain': 'axis_clk',
+        'reset': 'axis_rst',
+        'interfaces': 'axis_in:axis_out',
+        },
+    'AXI Lite' : 
+        {
+        'clock_domain': 'axilite_clk',
+        'reset': 'axilite_rst',
+        'interfaces': 'axilite_in',
+        },
+}
+
+def get_interface_clocks():
+    return interface_clocks
+
+# Generic Parameters -------------------------------------------------------------------------------
+
+def get_generic_parameters(input_width, output_width, user_width=0, reverse=False, address_width=64):
+    return [
+        ("address_width", address_width),
+        ("input_width",   input_width),
+        ("output_width",  output_width),
+        ("user_width",    user_width),
+        ("reverse",       reverse),
+    ]
+
+# GUI Script ---------------------------------------------------------------------------------------
+
+def build_gui():
+
+    parts = ['# Set GUI properties\n']
+    #Single walk: add each group, then move its generics (names & order) into it.
+    for group, desc in gui_interface.items():
+        parts.append(
+            f'ipgui::add_group -name {{{group}}} -component [ipx::current_core] '
+            '-parent [ipgui::get_pagespec -name "Page 0" '
+            f'-component [ipx::current_core] ] -display_name {{{group}}} -layout {{vertical}}\n')
+        for var, var_desc in desc['vars'].items():
+            parts.append(
+                'ipgui::move_param -component [ipx::current_core] '
+                f'-order {var_desc["order"]} [ipgui::get_guiparamspec -name "{var}" '
+                '-component [ipx::current_core]] -parent [ipgui::get_groupspec '
+                f'-name "{group}" -component [ipx::current_core]]\n'
+                f'set_property enablement_value false [ipx::get_user_parameters {var} -of_objects [ipx::current_core]]\n')
+    return "".join(parts)
+
+# Custom Buses Script ------------------------------------------------------------------------------
+
+def build_custom_buses():
+    # Port maps are derived from custom_interface (physical port -> logical port).
+    parts = []
+    for name, desc in custom_interface.items():
+        parts.append(f'proc_add_bus "{desc["name"]}" "{desc["type"]}" \\\n')
+        parts.append(f'    "Enjoy-Digital.com:interface:{name}_rtl:1.0" \\\n')
+        parts.append(f'    "Enjoy-Digital.com:interface:{name}:1.0" \\\n')
+        parts.append('    { \\\n')
+        for phys, logic in desc['signals'].items():
+            parts.append(f'        {{"{phys}" "{logic}"}} \\\n')
+        parts.append('    }\n')
+    return "".join(parts)
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+
+clkin_ios = [
+    ("axis_clk",  0, Pins(1)),
+    ("axis_rst",  0, Pins(1)),
+    ("axilite_clk",  0, Pins(1)),
+    ("axilite_rst",  0, Pins(1)),
+    ("irq"    ,  0, Pins(1)),
+]
+
+def get_clkin_ios():
+    return clkin_ios
+
+# Build Cache --------------------------------------------------------------------------------------
+
+def get_cache_hash(files, *contents):
+    h = hashlib.sha256()
+    for content in contents:
+        h.update(content.encode())
+    for f in files:
+        h.update(f.encode())
+        if os.path.exists(f):
+            with open(f, "rb") as reader:
+                h.update(reader.read())
+    return h.hexdigest()
+
+def is_cached(directory, cache_hash):
+    marker = os.path.join(directory, ".cache_hash")
+    if not os.path.exists(marker):
+        return False
+    with open(marker, "r") as reader:
+        return reader.read() == cache_hash
+
+def set_cached(directory, cache_hash):
+    with open(os.path.join(directory, ".cache_hash"), "w") as writer:
+        writer.write(cache_hash)
+
+def clear_cached(directory):
+    # Called before directory is modified: only a successful run recreates the marker.
+    try:
+        os.remove(os.path.join(directory, ".cache_hash"))
+    except FileNotFoundError:
+        pass
+
+# Process umask, read once at import (os.umask can only be read by setting it).
+umask = os.umask(0)
+os.umask(umask)
+
+def write_if_changed(path, content):
+    # Keep path (and its mtime) untouched when the content is already up to date.
+    path = Path(path)
+    data = content.encode("utf-8") # Paths in the scripts may not be ASCII.
+    if path.exists() and path.read_bytes() == data:
+        return
+    # mkstemp creates the file 0o600: keep the replaced file's mode, or apply the umask as open() does.
+    mode = (path.stat().st_mode & 0o7777) if path.exists() else (0o666 & ~umask)
+    # Write next to path then rename over it: an interrupted run never leaves a truncated file.
+    # Scripts are small, a single unbuffered write is enough.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix="." + path.name + ".")
+    try:
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def copy_if_changed(src, dst):
+    # Keep dst (and its mtime) untouched when the content is already up to date.
+    if not os.path.exists(dst) or not filecmp.cmp(src, dst, shallow=False):
+        shutil.copy2(src, dst)
+
+def remove_trees(paths):
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+def remove_in_background(path):
+    # Move path out of the way right away, then delete it while Vivado runs. The trash is created
+    # next to path's parent (ex: the IP root), not inside it. The thread is not a daemon: the
+    # interpreter waits for it at exit. Leftovers from interrupted runs are removed too.
+    path   = Path(path).absolute()
+    prefix = f".{path.parent.name}.{path.name}.old."
+    if path.exists():
+        trash = tempfile.mkdtemp(dir=path.parent.parent, prefix=prefix)
+        os.replace(path, os.path.join(trash, path.name))
+    trashes = list(path.parent.parent.glob(prefix + "*"))
+    if trashes:
+        threading.Thread(target=remove_trees, args=(trashes,)).start()
+
+# Vivado -------------------------------------------------------------------------------------------
+
+# Only warnings and errors are reported, and usage statistics are not collected.
+vivado_quiet_settings = """
+set_msg_config -severity INFO -suppress
+config_webtalk -user off
+""".strip() + "\n"
+
+def run_vivado(cwd, script, mode="batch", quiet=False):
+    cmd = ["vivado", "-mode", mode, "-notrace", "-nojournal", "-nolog", "-source", script]
+    # In quiet mode the log is kept, compressed, next to the script instead of on the console.
+    log_file = os.path.join(cwd, os.path.splitext(script)[0] + ".log.gz")
+    log = gzip.open(log_file, "wb") if quiet else sys.stdout.buffer
+    try:
+        with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as p:
+            # Stream Vivado's log as it comes so long runs stay visible (CI, terminal).
+            for line in iter(p.stdout.readline, b""):
+                log.write(line)
+                if not quiet:
+                    sys.stdout.flush()
+    finally:
+        if quiet:
+            log.close()
+    if p.returncode != 0:
+        raise subprocess.CalledProcessError(p.returncode, cmd)
+
+class VivadoScript:
+    """Tcl script to source from directory; recorded in the build cache once Vivado succeeds."""
+    def __init__(self, directory, script, cache_files, *cache_contents, depends=()):
+        self.directory      = directory
+        self.script         = script
+        self.cache_files    = cache_files
+        self.cache_contents = cache_contents
+        # Scripts producing some of cache_files (ex: the packager for component.xml).
+        self.depends        = [script for script in depends if script is not None]
+
+    def cache_hash(self):
+        return get_cache_hash(self.cache_files, *self.cache_contents)
+
+    def is_cached(self):
+        return is_cached(self.directory, self.cache_hash())
+
+def run_vivado_scripts(scripts, quiet=False, name="vivado_batch"):
+    # The cache is checked now, once earlier runs produced their outputs. A script whose
+    # dependencies run in this same session can't be checked beforehand: it always runs.
+    scheduled = []
+    for script in scripts:
+        if script is None:
+            continue
+        if any(depend in scheduled for depend in script.depends) or not script.is_cached():
+            scheduled.append(script)
+    scripts = scheduled
+    if len(scripts) == 0:
+        return
+    for script in scripts:
+        clear_cached(script.directory)
+    if len(scripts) == 1:
+        run_vivado(scripts[0].directory, scripts[0].script, quiet=quiet)
+    else:
+        # Source all the scripts from a single Vivado session: its startup is paid only once.
+        tcl = []
+        for script in scripts:
+            # Braces: no Tcl substitution in the path (ex: $ or [ in the checkout directory).
+            tcl.append(f"cd {{{os.path.abspath(script.directory)}}}")
+            tcl.append(f"source {script.script}")
+        write_if_changed(name + ".tcl", "\n".join(tcl))
+        run_vivado(".", name + ".tcl", quiet=quiet)
+    # Hash after the run: later scripts consume what earlier ones produced (ex: component.xml).
+    for script in scripts:
+        set_cached(script.directory, script.cache_hash())
+
+def run_vivado_stages(stages, jobs=1, quiet=False, name="vivado_batch"):
+    # Stages run in order; the scripts of a stage are independent from each other (ex: interfaces and
+    # packages, then the projects using them).
+    stages = [[script for script in stage if script is not None] for stage in stages]
+    if jobs <= 1:
+        return run_vivado_scripts(sum(stages, []), quiet=quiet, name=name)
+    # Spread each stage over up to jobs Vivado sessions (Vivado is itself multi-threaded, keep jobs low).
+    for n, stage in enumerate(stages):
+        if not stage:
+            continue
+        groups = [stage[i::jobs] for i in range(min(jobs, len(stage)))]
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            futures = [executor.submit(run_vivado_scripts, group, quiet, f"{name}_{n}_{i}")
+                for i, group in enumerate(groups)]
+            for future in as_completed(futures):
+                future.result()
+
+# AXIConverter -------------------------------------------------------------------------------------
+
+class AXIConverter(Module):
+    def __init__(self, platform, address_width=64, input_width=64, output_width=64, user_width=0, reverse=False,
+        enable_ila=False):
+        # SAve input parameter as generic for later use.
+        self.address_width = address_width
+        self.input_width   = input_width
+        self.output_width  = output_width
+        self.user_width    = user_width
+        self.reverse       = reverse
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        axis_clk    = platform.request("axis_clk")
+        axis_rst    = platform.request("axis_rst")
+        axilite_clk = platform.request("axilite_clk")
+        axilite_rst = platform.request("axilite_rst")
+
+        self.clock_domains.cd_sys      = ClockDomain()
+        self.clock_domains.cd_syslite  = ClockDomain()
+        self.comb += [
+            self.cd_sys.clk.eq(axis_clk),
+            self.cd_sys.rst.eq(axis_rst),
+            self.cd_syslite.clk.eq(axilite_clk),
+            self.cd_syslite.rst.eq(axilite_rst),
+        ]
+
+        # Input AXI Lite ---------------------------------------------------------------------------
+        axilite_in = AXILiteInterface(data_width=32, address_width=address_width, clock_domain="cd_syslite")
+        platform.add_extension(axilite_in.get_ios("axilite_in"))
+        axilite_in_pads = platform.request("axilite_in")
+        self.comb += axilite_in.connect_to_pads(axilite_in_pads, mode="slave")
+
+        # Input AXI --------------------------------------------------------------------------------
+        axis_in = AXIStreamInterface(data_width=input_width, user_width=user_width)
+        platform.add_extension(axis_in.get_ios("axis_in"))
+        axis_in_pads = platform.request("axis_in")
+        self.comb += axis_in.connect_to_pads(axis_in_pads, mode="slave")
+
+        # Output AXI -------------------------------------------------------------------------------
+        axis_out = AXIStreamInterface(data_width=output_width, user_width=user_width)
+        platform.add_extension(axis_out.get_ios("axis_out"))
+        axis_out_pads = platform.request("axis_out")
+        self.comb += axis_out.connect_to_pads(axis_out_pads, mode="master")
+
+        # Custom interface -----------------------------------------------------------------------
+        wishbone_in = wishbone.Interface(data_width=16)
+        platform.add_extension(wishbone_in.get_ios("wishbone_in"))
+        wishbone_in_pads = platform.request("wishbone_in")
+        self.comb += wishbone_in.connect_to_pads(wishbone_in_pads, mode="slave")
+
+        self.submodules.ev = ev.EventManager()
+        self.ev.my_int1 = ev.EventSourceProcess()
+        self.ev.my_int2 = ev.EventSourceProcess()
+        self.ev.finalize()
+
+        irq = platform.request("irq")
+        self.comb += [
+            self.ev.my_int1.trigger.eq(0),
+            self.ev.my_int2.trigger.eq(1),
+            irq.eq(self.ev.irq),
+        ]
+
+        # Converter --------------------------------------------------------------------------------
+        converter = stream.StrideConverter(axis_in.description, axis_out.description, reverse=reverse)
+        self.submodules += converter
+        self.comb += [
+            axis_in.connect(converter.sink),
+            converter.source.connect(axis_out),
+        ]
+
+        # ILA (debug only) -------------------------------------------------------------------------
+        if enable_ila:
+            platform.add_source("ila/ila.xci")
+            probe0 = Signal(2)
+            self.comb += probe0.eq(Cat(self.ev.irq, self.ev.my_int1.trigger))
+            self.specials += [
+                Instance("ila", i_clk=self.cd_sys.clk, i_probe0=probe0),
+            ]
+
+# Verilog Post Processing --------------------------------------------------------------------------
+
+def _netlist_post_processing(infile, outfile, generic_parameters):
+    parameters = "".join(f"parameter {name} = {int(value)};\n" for name, value in generic_parameters)
+    with open(infile, 'r') as reader, open(outfile, 'w') as writer:
+        # Parameters are inserted after the port list, the rest of the netlist is copied as is.
+        for line in reader:
+            writer.write(line)
+            if line.startswith(");\n"):
+                writer.write(parameters)
+                shutil.copyfileobj(reader, writer)
+                break
+
+# XDC Post Processing ------------------------------------------------------------------------------
+
+def _constraints_post_processing(infile, outfile):
+    with open(infile, 'rb') as reader, open(outfile, 'wb') as writer:
+        if os.fstat(reader.fileno()).st_size == 0:
+            return
+        # Locate the design constraints with a single scan, then copy them (from their line) as is.
+        with mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ) as constraints:
+            offset = constraints.find(b"Design constraints")
+            if offset >= 0:
+                constraints.seek(constraints.rfind(b"\n", 0, offset) + 1)
+                shutil.copyfileobj(constraints, writer)
+
+# Templates ----------------------------------------------------------------------------------------
+
+templates_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+@functools.lru_cache(maxsize=None)
+def get_project_template():
+    # Read once per process; only the ${...} placeholders differ between width configurations.
+    with open(os.path.join(templates_dir, "project.tcl.in"), "r") as reader:
+        return Template(reader.read())
+
+# Packaging ----------------------------------------------------------------------------------------
+
+# Build independent head of the packager script: Vivado settings and procedure declarations.
+packager_prefix = vivado_quiet_settings + "\n" + packager_procs + "\n"
+
+@functools.lru_cache(maxsize=32)
+def get_packager_tcl(build_name, enable_ila=False):
+    version_number = "1.3"
+
+    # Prepare Vivado's tcl core packager script
+    tcl = io.StringIO()
+    w   = tcl.write
+    w(packager_prefix)
+    # Create projet and send commands:
+    w(f"create_project -force -name {build_name}_packager\n")
+
+    #Add files
+    ip_files = f"\"./{build_name}.xdc\" \"./{build_name}.v\""
+    if enable_ila:
+        ip_files = "\"./ila.xci\" " + ip_files
+    w(f"proc_add_ip_files \"{build_name}\"  \"[list {ip_files}]\" \n")
+
+    w("ipx::package_project -root_dir . -vendor Enjoy-Digital.com -library user -taxonomy /Enjoy_Digital\n")
+    w(f"set_property name {build_name} [ipx::current_core]\n")
+    # w("proc_set_device_family \"zynq Production\"\n")
+    w("proc_set_device_family \"all\"\n")
+    w("ipx::save_core [ipx::current_core]\n")
+
+    w(build_custom_buses())
+    w("proc_add_bus_clock \"axilite_clk\" \"wishbone_in\" \"axilite_rst\"\n")
+
+    #FIXME: How to retrieve from LiteX the clock, reset and interface names?
+    w("proc_add_bus_clock \"axis_clk\" \"axis_in:axis_out\" \"axis_rst\"\n")
+    w("proc_add_bus_clock \"axilite_clk\" \"axilite_in\" \"axilite_rst\"\n")
+    w("proc_declare_interrupt \"irq\"\n")
+
+    #GUI customization
+    w(build_gui() + "\n")
+    w(f"proc_set_version \"AXIConverter\"  \"{version_number}\" \"0\" \"axi_converter IP (Packaging Proof of Concept)\"\n")
+
+    w("ipx::create_xgui_files [ipx::current_core]\n")
+    w("ipx::update_checksums [ipx::current_core]\n")
+    w("ipx::check_integrity -quiet [ipx::current_core]\n")
+    w("ipx::save_core [ipx::current_core]\n")
+    w(f"proc_archive_ip \"Enjoy-Digital\" \"{build_name}\" \"{version_number}\"\n")
+    w("close_project\n")
+    return tcl.getvalue()
+
+def generate_package(build_name, generic_parameters, enable_ila=False, quiet=False, run=True):
+    package = f"package_{build_name}"
+    tcl     = get_packager_tcl(build_name, enable_ila)
+
+    # Skip packaging when neither the core files nor the script changed since the last run
+    parameters = str(generic_parameters)
+    core_files = [f"build/{build_name}.v", f"build/{build_name}.xdc"]
+    if enable_ila:
+        core_files.append("ila/ila.xci")
+    script = VivadoScript(package, "packager.tcl", core_files, tcl, parameters)
+    if script.is_cached():
+        return None
+
+    # Create package directory (kept across runs, only the packager sources are refreshed)
+    Path(package).mkdir(parents=True, exist_ok=True)
+    clear_cached(package)
+    remove_in_background(Path(package, "src"))
+
+    # Copy core files to package
+    if enable_ila:
+        copy_if_changed("ila/ila.xci", os.path.join(package, "ila.xci"))
+    # Netlist and constraints are independent files: rewrite them concurrently.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_netlist_post_processing,
+                f"build/{build_name}.v", f"{package}/{build_name}.v", generic_parameters),
+            executor.submit(_constraints_post_processing,
+                f"build/{build_name}.xdc", f"{package}/{build_name}.xdc"),
+        ]
+        for future in futures:
+            future.result()
+    # SEBO : Issue #11.
+
+    write_if_changed(Path(package, "packager.tcl"), tcl)
+
+    # Run Vivado's tcl core packager script
+    if run:
+        run_vivado_scripts([script], quiet=quiet)
+    return script
+
+def generate_project(build_name, package=None, quiet=False, run=True, depends=()):
+    part = "xc7z010iclg225-1L"
+    # Vivado caps general.maxThreads at 8.
+    max_threads = min(os.cpu_count() or 1, 8)
+
+    # Create project directory
+    project = f"project_{build_name}"
+    # Package directory (defaults to the one created by generate_package)
+    if package is None:
+        package = f"package_{build_name}"
+
+    # Prepare Vivado's tcl project script
+    tcl = get_project_template().safe_substitute(
+        MAX_THREADS = max_threads,
+        PROJECT     = project,
+        BUILD_NAME  = build_name,
+        PART        = part,
+        LIB_DIRS    = f"../{package} ../interfaces")
+
+    # Skip project creation when neither the packaged core, the custom interfaces nor the script
+    # changed. When the packager or the interfaces (depends) still have to run, their outputs are
+    # not final yet: the check is left to run_vivado_scripts.
+    cache_files = ["bd_axi_converter_128b_to_64b.tcl", f"{package}/component.xml"]
+    for if_name in custom_interface_declaration:
+        cache_files += [f"interfaces/{if_name}.xml", f"interfaces/{if_name}_rtl.xml"]
+    script = VivadoScript(project, "project.tcl", cache_files, tcl, depends=depends)
+    cached = script.is_cached()
+    if cached and not script.depends:
+        return None
+
+    Path(project).mkdir(parents=True, exist_ok=True)
+    if not cached:
+        clear_cached(project)
+
+    write_if_changed(Path(project, "project.tcl"), tcl)
+
+    # Run Vivado's tcl project script
+    if run:
+        run_vivado_scripts([script], quiet=quiet)
+    return script
+
+def generate_interface(quiet=False, run=True):
+    project = "interfaces"
+    Path(project).mkdir(parents=True, exist_ok=True)
+
+    # Prepare Vivado's tcl interface build script
+    buf = io.StringIO()
+    w   = buf.write
+    w(vivado_quiet_settings + "\n")
+    # Declare Procedures
+    w(interface_procs + "\n")
+    for if_name, desc in custom_interface_declaration.items():
+        w(f"set if_name {if_name}\n")
+        # declare the interface name
+        w("proc_define_interface $if_name\n")
+        # declare the interface ports
+        buf.writelines(f"proc_define_interface_port {name} {width} {direction} \n"
+            for name, width, direction in desc['signals'])
+
+    tcl = buf.getvalue()
+
+    script = VivadoScript(project, "interfaces.tcl", [], tcl)
+    if script.is_cached():
+        return None
+    clear_cached(project)
+    write_if_changed(Path(project, "interfaces.tcl"), tcl)
+
+    # Run Vivado's tcl interface build script
+    if run:
+        run_vivado_scripts([script], quiet=quiet)
+    return script
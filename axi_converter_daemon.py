@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import argparse
+import traceback
+import socketserver
+
+import axi_converter
+
+# Daemon -------------------------------------------------------------------------------------------
+
+class BuildRequestHandler(socketserver.StreamRequestHandler):
+    # One JSON object per connection, keys are axi_converter.py's options plus the client's working
+    # directory (ex: {"cwd": "/path/to/checkout", "input_width": 128, "output_width": 32,
+    # "build": true, "package": true}). Requests are served one at a time, from that directory.
+    def handle(self):
+        daemon_cwd = os.getcwd()
+        try:
+            request = json.loads(self.rfile.readline())
+            cwd     = request.pop("cwd", None)
+            if cwd is None:
+                raise ValueError("missing client working directory (cwd)")
+            args    = axi_converter.get_argument_parser().parse_args([])
+            for name, value in request.items():
+                if not hasattr(args, name) or name == "daemon":
+                    raise ValueError(f"unknown option: {name}")
+                setattr(args, name, value)
+            os.chdir(cwd)
+            axi_converter.run(args)
+            response = {"status": "ok"}
+        except Exception as e:
+            traceback.print_exc()
+            response = {"status": "error", "message": str(e)}
+        finally:
+            os.chdir(daemon_cwd)
+        self.wfile.write((json.dumps(response) + "\n").encode())
+
+def main():
+    parser = argparse.ArgumentParser(description="AXI Converter build daemon")
+    parser.add_argument("--socket", default="/tmp/axi_converter.sock", help="Unix socket path (default=/tmp/axi_converter.sock).")
+    args = parser.parse_args()
+
+    # Pay migen/LiteX import cost once for all the requests.
+    import axi_converter_core  # noqa: F401
+    import litex.build.xilinx  # noqa: F401
+
+    if os.path.exists(args.socket):
+        os.unlink(args.socket)
+    with socketserver.UnixStreamServer(args.socket, BuildRequestHandler) as server:
+        print(f"axi_converter daemon listening on {args.socket}")
+        sys.stdout.flush()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(args.socket)
+
+if __name__ == "__main__":
+    main()